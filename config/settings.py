@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TradingConfig:
     """Configuration for trading parameters"""
     grid_distance: float = 5.0      # Default for stocks
@@ -21,7 +21,7 @@ class TradingConfig:
     atr_period: int = 14            # ATR calculation period
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DataConfig:
     """Configuration for data fetching"""
     interval: str = '1d'  # Use daily data for reliable access
@@ -95,6 +95,22 @@ SUPPORTED_ASSETS = {
     'DBA': {'midprice': 26.1, 'grid_distance': 0.5, 'grid_range': 5, 'name': 'Agriculture ETF'},
 }
 
+# Precomputed indexes over SUPPORTED_ASSETS so consumers get O(1) lookups
+# instead of rescanning the dict on every call / UI refresh
+ASSET_KEYS = tuple(SUPPORTED_ASSETS)
+ASSET_BY_NAME = {info['name']: symbol for symbol, info in SUPPORTED_ASSETS.items()}
+
+# Lowercase -> canonical symbol, so user input can be resolved case-insensitively
+SUPPORTED_ASSETS_CI = {k.lower(): k for k in SUPPORTED_ASSETS}
+
+ASSETS_BY_CATEGORY = {
+    'crypto': frozenset(k for k in SUPPORTED_ASSETS if k.endswith('-USD')),
+    'forex': frozenset(k for k in SUPPORTED_ASSETS if k.endswith('=X')),
+    'futures': frozenset(k for k in SUPPORTED_ASSETS if k.endswith('=F')),
+}
+ASSETS_BY_CATEGORY['stocks'] = frozenset(SUPPORTED_ASSETS) - frozenset().union(*ASSETS_BY_CATEGORY.values())
+
+
 # Streamlit configuration
 STREAMLIT_CONFIG = {
     'page_title': 'Grid Trading Strategy Backtester',
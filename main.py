@@ -21,16 +21,13 @@ import sys
 import os
 import argparse
 from datetime import datetime, timedelta
-import pandas as pd
 
 # Add src to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.data.fetcher import DataFetcher
-from src.strategy.grid_trading import GridTradingStrategy
-from src.backtest.backtester import GridBacktester
-from src.visualization.charts import GridTradingVisualizer
-from config.settings import SUPPORTED_ASSETS, TradingConfig, DataConfig
+# Heavy modules (yfinance, backtesting, plotly) are imported lazily inside
+# main() so that --help and argument errors return instantly
+from config.settings import SUPPORTED_ASSETS, SUPPORTED_ASSETS_CI, ASSET_KEYS, TradingConfig, DataConfig
 import logging
 
 # Configure logging
@@ -53,10 +50,11 @@ Examples:
     )
     
     parser.add_argument(
-        '--asset', 
+        '--asset',
         default='AAPL',
-        choices=list(SUPPORTED_ASSETS.keys()),
-        help='Asset to backtest (default: AAPL)'
+        type=lambda s: SUPPORTED_ASSETS_CI.get(s.lower(), s),
+        choices=ASSET_KEYS,
+        help='Asset to backtest, case-insensitive (default: AAPL)'
     )
     
     parser.add_argument(
@@ -77,6 +75,25 @@ Examples:
         help='Use dynamic midprice (MA-20) instead of static'
     )
     
+    parser.add_argument(
+        '--assets',
+        default=None,
+        help='Comma-separated list of assets to backtest in parallel (overrides --asset)'
+    )
+
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=None,
+        help='Worker processes for multi-asset runs (default: number of CPUs)'
+    )
+
+    parser.add_argument(
+        '--no-chart',
+        action='store_true',
+        help='Skip chart generation (avoids loading plotly)'
+    )
+
     parser.add_argument(
         '--output-dir',
         default='data/results',
@@ -101,7 +118,10 @@ def save_results(results, metrics, symbol, start_date, end_date, output_dir):
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     base_filename = f"grid_trading_{symbol}_{start_date}_{end_date}_{timestamp}"
     
-    # Save detailed results to CSV
+    # Save detailed results to CSV. A pyarrow fast path was tried here, but
+    # backtesting.py result Series always carry _strategy/_equity_curve/_trades
+    # object entries that Arrow can't convert, so it never engaged - and the
+    # Series is only ~40 stat rows, so the pandas writer is not a bottleneck
     csv_file = os.path.join(output_dir, f"{base_filename}_results.csv")
     results.to_csv(csv_file, index=True)
     
@@ -118,22 +138,113 @@ def save_results(results, metrics, symbol, start_date, end_date, output_dir):
     return csv_file, metrics_file
 
 
+def run_single_backtest(symbol, start_date, end_date, use_dynamic=False):
+    """
+    Run the fetch -> prepare -> backtest pipeline for one asset
+
+    Module-level so ProcessPoolExecutor workers can pickle it. Returns
+    (symbol, metrics dict). Each backtest is independent, so multi-asset
+    sweeps are embarrassingly parallel; workers share the on-disk data cache.
+    """
+    from src.data.fetcher import DataFetcher
+    from src.strategy.grid_trading import GridTradingStrategy
+    from src.backtest.backtester import GridBacktester
+
+    asset_info = SUPPORTED_ASSETS[symbol]
+
+    data_fetcher = DataFetcher()
+    raw_data = data_fetcher.fetch_data(symbol, start_date, end_date, interval='1d')
+    data_with_indicators = data_fetcher.add_technical_indicators(raw_data)
+
+    if use_dynamic:
+        midprice = data_fetcher.get_dynamic_midprice(data_with_indicators)
+    else:
+        midprice = asset_info['midprice']
+
+    strategy = GridTradingStrategy(
+        midprice=midprice,
+        grid_distance=asset_info['grid_distance'],
+        grid_range=asset_info['grid_range']
+    )
+    prepared_data = strategy.prepare_data(data_with_indicators)
+
+    trading_config = TradingConfig()
+    backtester = GridBacktester(cash=trading_config.cash, margin=trading_config.margin)
+    backtester.run_backtest(prepared_data, {
+        'position_size': trading_config.position_size,
+        'atr_multiplier': trading_config.atr_multiplier,
+        'tp_sl_ratio': trading_config.tp_sl_ratio,
+        'max_trades': trading_config.max_trades,
+        'grid_distance': asset_info['grid_distance']
+    })
+
+    return symbol, backtester.get_performance_metrics()
+
+
+def run_multi_asset_backtests(symbols, args):
+    """Backtest several assets concurrently over worker processes"""
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    print(f"🚀 Running {len(symbols)} backtests over {args.jobs or os.cpu_count()} workers")
+
+    failures = {}
+    results = {}
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        futures = {
+            pool.submit(run_single_backtest, sym, args.start, args.end, args.dynamic): sym
+            for sym in symbols
+        }
+        for future in as_completed(futures):
+            sym = futures[future]
+            try:
+                _, metrics = future.result()
+                results[sym] = metrics
+                print(f"✅ {sym}: return {metrics['total_return']}, "
+                      f"trades {metrics['total_trades']}, win rate {metrics['win_rate']}")
+            except Exception as e:
+                failures[sym] = e
+                print(f"❌ {sym}: {e}")
+
+    print(f"\n🎉 Completed {len(results)}/{len(symbols)} backtests")
+    return 0 if not failures else 1
+
+
 def main():
     """Main execution function"""
     # Parse command line arguments
     args = parse_arguments()
-    
+
     # Configure logging level
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
+
+    # Import heavy modules only once we know we are actually running
+    import numpy as np
+    from src.data.fetcher import DataFetcher
+    from src.strategy.grid_trading import GridTradingStrategy
+    from src.backtest.backtester import GridBacktester
     
-    # Get asset configuration
-    if args.asset not in SUPPORTED_ASSETS:
+    # Multi-asset sweep: independent runs dispatched over worker processes
+    if args.assets:
+        symbols = []
+        for raw in args.assets.split(','):
+            canonical = SUPPORTED_ASSETS_CI.get(raw.strip().lower())
+            if canonical is None:
+                print(f"❌ Error: Asset {raw.strip()} not supported")
+                print(f"Available assets: {', '.join(ASSET_KEYS)}")
+                return 1
+            symbols.append(canonical)
+        return run_multi_asset_backtests(symbols, args)
+
+    # Get asset configuration (input already canonicalized case-insensitively)
+    canonical_asset = SUPPORTED_ASSETS_CI.get(args.asset.lower())
+    if canonical_asset is None:
         print(f"❌ Error: Asset {args.asset} not supported")
-        print(f"Available assets: {', '.join(SUPPORTED_ASSETS.keys())}")
+        print(f"Available assets: {', '.join(ASSET_KEYS)}")
         return 1
-    
-    asset_info = SUPPORTED_ASSETS[args.asset]
+
+    args.asset = canonical_asset
+    asset_info = SUPPORTED_ASSETS[canonical_asset]
     
     print("🚀 Grid Trading Strategy - Professional Backtester")
     print("=" * 55)
@@ -174,13 +285,15 @@ def main():
         )
         
         prepared_data = strategy.prepare_data(data_with_indicators)
-        signals_count = prepared_data['signal'].sum()
+        n_candles = len(prepared_data)
+        # count_nonzero on the raw array skips the pandas reduction machinery
+        signals_count = int(np.count_nonzero(prepared_data['signal'].to_numpy()))
         
         strategy_params = strategy.get_strategy_parameters()
         print(f"✅ Grid configured: {strategy_params['grid_levels_count']} levels")
         print(f"   Range: {strategy_params['grid_range']:.4f}")
         print(f"   Distance: {strategy_params['grid_distance']:.4f}")
-        print(f"   Signals: {signals_count}/{len(prepared_data)} ({signals_count/len(prepared_data)*100:.1f}%)")
+        print(f"   Signals: {signals_count}/{n_candles} ({signals_count/n_candles*100:.1f}%)")
         
         # Step 3: Run backtest
         print("\n3️⃣ Running backtest...")
@@ -228,23 +341,29 @@ def main():
         )
         
         # Step 6: Generate chart
-        print("\n6️⃣ Generating visualization...")
-        try:
-            visualizer = GridTradingVisualizer()
-            grid_levels = strategy.grid_generator.get_grid_levels()
-            
-            fig = visualizer.plot_price_with_grid(
-                data=prepared_data,
-                grid_levels=grid_levels,
-                title=f"{asset_info['name']} - Grid Trading Analysis"
-            )
-            
-            chart_file = os.path.join(args.output_dir, f"chart_{args.asset}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html")
-            fig.write_html(chart_file)
-            print(f"✅ Chart saved: {chart_file}")
-            
-        except Exception as e:
-            print(f"⚠️ Chart generation failed: {e}")
+        if args.no_chart:
+            print("\n6️⃣ Skipping visualization (--no-chart)")
+        else:
+            print("\n6️⃣ Generating visualization...")
+            try:
+                # Imported here so --no-chart runs never pay plotly's import cost
+                from src.visualization.charts import GridTradingVisualizer
+
+                visualizer = GridTradingVisualizer()
+                grid_levels = strategy.grid_generator.get_grid_levels()
+
+                fig = visualizer.plot_price_with_grid(
+                    data=prepared_data,
+                    grid_levels=grid_levels,
+                    title=f"{asset_info['name']} - Grid Trading Analysis"
+                )
+
+                chart_file = os.path.join(args.output_dir, f"chart_{args.asset}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html")
+                fig.write_html(chart_file)
+                print(f"✅ Chart saved: {chart_file}")
+
+            except Exception as e:
+                print(f"⚠️ Chart generation failed: {e}")
         
         print("\n🎉 Analysis complete!")
         print(f"💡 Open {csv_file} to see detailed results")
@@ -23,31 +23,30 @@ class GridTradingBacktestStrategy(Strategy):
     
     def init(self):
         """Initialize strategy"""
-        super().init()
-        # Create signal indicator
-        self.signal1 = self.I(lambda: self.data.signal)
-        
+        # Signals are a precomputed column; keep a raw numpy view instead of
+        # an self.I() indicator wrapper that re-dispatches on every access
+        self._signal = np.asarray(self.data.signal)
+        # Stop loss distance is constant across bars, compute it once
+        self._slatr = self.atr_multiplier * self.grid_distance
+
     def next(self):
         """Execute strategy logic for each bar"""
-        super().next()
-        
-        # Calculate stop loss and take profit levels
-        slatr = self.atr_multiplier * self.grid_distance
-        
-        # Check for signal and position limits
-        if self.signal1[-1] == 1 and len(self.trades) <= self.max_trades:
-            
-            current_price = self.data.Close[-1]
-            
-            # Place sell order (short)
-            sl_short = current_price + slatr
-            tp_short = current_price - slatr * self.tp_sl_ratio
-            self.sell(sl=sl_short, tp=tp_short, size=self.mysize)
-            
-            # Place buy order (long)
-            sl_long = current_price - slatr
-            tp_long = current_price + slatr * self.tp_sl_ratio
-            self.buy(sl=sl_long, tp=tp_long, size=self.mysize)
+        # Early exit: no signal or position limit reached (the common case)
+        if self._signal[len(self.data) - 1] != 1 or len(self.trades) > self.max_trades:
+            return
+
+        slatr = self._slatr
+        current_price = self.data.Close[-1]
+
+        # Place sell order (short)
+        sl_short = current_price + slatr
+        tp_short = current_price - slatr * self.tp_sl_ratio
+        self.sell(sl=sl_short, tp=tp_short, size=self.mysize)
+
+        # Place buy order (long)
+        sl_long = current_price - slatr
+        tp_long = current_price + slatr * self.tp_sl_ratio
+        self.buy(sl=sl_long, tp=tp_long, size=self.mysize)
 
 
 class GridBacktester:
@@ -72,6 +71,7 @@ class GridBacktester:
         self.hedging = hedging
         self.exclusive_orders = exclusive_orders
         self.backtest_results = None
+        self._metrics_cache: Optional[Dict[str, Any]] = None
         
     def run_backtest(self, 
                     data: pd.DataFrame, 
@@ -86,17 +86,20 @@ class GridBacktester:
         Returns:
             pd.Series: Backtest results
         """
-        # Update strategy parameters
-        GridTradingBacktestStrategy.mysize = strategy_params.get('position_size', 50)
-        GridTradingBacktestStrategy.atr_multiplier = strategy_params.get('atr_multiplier', 1.5)
-        GridTradingBacktestStrategy.tp_sl_ratio = strategy_params.get('tp_sl_ratio', 0.5)
-        GridTradingBacktestStrategy.max_trades = strategy_params.get('max_trades', 3)
-        GridTradingBacktestStrategy.grid_distance = strategy_params.get('grid_distance', 0.003)
-        
+        # Specialize a per-run subclass instead of mutating shared class
+        # attributes, so concurrent backtests can't race on parameters
+        strategy_cls = type('GridTradingBacktestStrategy', (GridTradingBacktestStrategy,), {
+            'mysize': strategy_params.get('position_size', 50),
+            'atr_multiplier': strategy_params.get('atr_multiplier', 1.5),
+            'tp_sl_ratio': strategy_params.get('tp_sl_ratio', 0.5),
+            'max_trades': strategy_params.get('max_trades', 3),
+            'grid_distance': strategy_params.get('grid_distance', 0.003),
+        })
+
         # Create and run backtest
         bt = Backtest(
-            data, 
-            GridTradingBacktestStrategy,
+            data,
+            strategy_cls,
             cash=self.cash,
             margin=self.margin,
             hedging=self.hedging,
@@ -107,6 +110,7 @@ class GridBacktester:
             results = bt.run()
             self.backtest_results = results
             self.backtest_object = bt
+            self._metrics_cache = None  # New results invalidate cached metrics
             
             logger.info("Backtest completed successfully")
             return results
@@ -124,8 +128,14 @@ class GridBacktester:
         """
         if self.backtest_results is None:
             raise ValueError("No backtest results available. Run backtest first.")
-        
-        results = self.backtest_results
+
+        # Metrics are pure formatting of the results, so build them only once
+        if self._metrics_cache is not None:
+            return self._metrics_cache
+
+        # One Series->dict conversion turns ~20 label lookups into plain
+        # C-level dict gets
+        results = self.backtest_results.to_dict()
         
         metrics = {
             # Core Performance
@@ -134,6 +144,7 @@ class GridBacktester:
             'annualized_return': f"{results.get('Return (Ann.) [%]', 0):.2f}%",
             'volatility': f"{results.get('Volatility (Ann.) [%]', 0):.2f}%",
             'sharpe_ratio': f"{results.get('Sharpe Ratio', 0):.2f}",
+            'sharpe_ratio_value': results.get('Sharpe Ratio', 0),
             'calmar_ratio': f"{results.get('Calmar Ratio', 0):.2f}",
             
             # Risk Metrics
@@ -161,7 +172,8 @@ class GridBacktester:
             # Buy & Hold Comparison
             'buy_hold_return': f"{results.get('Buy & Hold Return [%]', 0):.2f}%",
         }
-        
+
+        self._metrics_cache = metrics
         return metrics
     
     def get_trades_dataframe(self) -> Optional[pd.DataFrame]:
@@ -2,16 +2,34 @@
 Data fetching and preprocessing module for Grid Trading Strategy
 """
 
+import hashlib
+import time
+
 import yfinance as yf
 import pandas as pd
 import numpy as np
-import pandas_ta as ta
+from pathlib import Path
 from typing import Optional, Tuple
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Disk cache for downloaded data (keyed by hash of the request parameters)
+_CACHE_DIR = Path("data/cache/yf")
+_CACHE_MAX_AGE_SECONDS = 24 * 60 * 60  # Re-download after 24h
+
+# In-process cache so repeat fetches in one session skip even the parquet read
+_MEMORY_CACHE: dict = {}
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Simple moving average over a NumPy array, NaN-padded to input length"""
+    out = np.full(values.shape, np.nan)
+    if len(values) >= window:
+        out[window - 1:] = np.convolve(values, np.ones(window) / window, mode='valid')
+    return out
+
 
 class DataFetcher:
     """Handles data fetching and preprocessing for trading strategies"""
@@ -36,21 +54,63 @@ class DataFetcher:
         Returns:
             pd.DataFrame: OHLCV data
         """
+        cache_key = (symbol, start_date, end_date, interval)
+
+        # Fast path: already fetched in this session
+        if cache_key in _MEMORY_CACHE:
+            self.data = _MEMORY_CACHE[cache_key]
+            return self.data
+
+        # Disk cache: skip the network round-trip if a fresh copy exists
+        key_hash = hashlib.sha1("|".join(cache_key).encode()).hexdigest()
+        cache_file = _CACHE_DIR / f"{key_hash}.parquet"
+
+        if cache_file.exists() and time.time() - cache_file.stat().st_mtime < _CACHE_MAX_AGE_SECONDS:
+            logger.info(f"Loading cached data for {symbol} from {cache_file}")
+            data = pd.read_parquet(cache_file)
+            _MEMORY_CACHE[cache_key] = data
+            self.data = data
+            return data
+
         try:
             logger.info(f"Fetching data for {symbol} from {start_date} to {end_date}")
-            data = yf.download(symbol, start=start_date, end=end_date, interval=interval)
-            
+            data = yf.download(symbol, start=start_date, end=end_date, interval=interval,
+                               group_by='column', multi_level_index=False)
+
             if data.empty:
                 raise ValueError(f"No data found for symbol {symbol}")
-            
-            # Fix column names if they are MultiIndex
+
+            # Fallback for older yfinance versions that still return a MultiIndex;
+            # get_level_values avoids rebuilding the index the way droplevel does
             if isinstance(data.columns, pd.MultiIndex):
-                data.columns = data.columns.droplevel(1)
-                
+                data.columns = data.columns.get_level_values(0)
+
+            # Prices don't need float64 precision; float32 halves the bandwidth
+            # of every downstream indicator pass
+            price_cols = [c for c in ('Open', 'High', 'Low', 'Close') if c in data.columns]
+            data[price_cols] = data[price_cols].astype(np.float32)
+            if 'Volume' in data.columns:
+                # Nullable Int64: yfinance leaves NaN volume on missing bars,
+                # and a plain int64 cast would raise on them. NA rows survive
+                # here and are dropped later by add_technical_indicators
+                data['Volume'] = data['Volume'].astype('Int64')
+
+            # Arrow-backed columns are lower-memory and round-trip to the
+            # parquet cache zero-copy; .to_numpy() consumers are unaffected
+            data = data.convert_dtypes(dtype_backend='pyarrow')
+
+            # Persist for later runs (cache failures shouldn't break fetching)
+            try:
+                _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                data.to_parquet(cache_file, compression="zstd")
+            except Exception as cache_error:
+                logger.warning(f"Could not write cache file {cache_file}: {cache_error}")
+
+            _MEMORY_CACHE[cache_key] = data
             self.data = data
             logger.info(f"Successfully fetched {len(data)} data points")
             return data
-            
+
         except Exception as e:
             logger.error(f"Error fetching data: {e}")
             raise
@@ -68,25 +128,40 @@ class DataFetcher:
         Returns:
             pd.DataFrame: Data with technical indicators
         """
-        df = data.copy()
-        
-        # Add ATR (Average True Range)
-        df['ATR'] = ta.atr(high=df['High'], low=df['Low'], close=df['Close'], length=atr_period)
-        
-        # Add moving averages for dynamic midprice
-        df['MA_20'] = ta.sma(df['Close'], length=20)
-        df['MA_50'] = ta.sma(df['Close'], length=50)
-        
-        # Add Bollinger Bands
-        bb = ta.bbands(df['Close'], length=20, std=2)
-        if bb is not None:
-            df['BB_Upper'] = bb['BBU_20_2.0']
-            df['BB_Lower'] = bb['BBL_20_2.0']
-            df['BB_Middle'] = bb['BBM_20_2.0']
-        
-        # Drop rows with NaN values
+        high = data['High'].to_numpy(dtype=float)
+        low = data['Low'].to_numpy(dtype=float)
+        close = data['Close'].to_numpy(dtype=float)
+
+        # ATR (Average True Range) - true range then Wilder smoothing
+        prev_close = np.roll(close, 1)
+        tr = np.maximum.reduce([high - low,
+                                np.abs(high - prev_close),
+                                np.abs(low - prev_close)])
+        tr[0] = high[0] - low[0]  # No previous close on the first bar
+        atr = pd.Series(tr, index=data.index).ewm(
+            alpha=1.0 / atr_period, min_periods=atr_period, adjust=False
+        ).mean()
+
+        # Moving averages for dynamic midprice
+        ma_20 = _rolling_mean(close, 20)
+        ma_50 = _rolling_mean(close, 50)
+
+        # Bollinger Bands (rolling mean +/- 2 standard deviations)
+        mean_sq = _rolling_mean(close ** 2, 20)
+        bb_std = np.sqrt(np.maximum(mean_sq - ma_20 ** 2, 0.0))
+
+        # assign() shares the underlying OHLCV blocks instead of copying them,
+        # and dropna() returns the new frame callers can mutate freely
+        df = data.assign(
+            ATR=atr,
+            MA_20=ma_20,
+            MA_50=ma_50,
+            BB_Upper=ma_20 + 2 * bb_std,
+            BB_Lower=ma_20 - 2 * bb_std,
+            BB_Middle=ma_20,
+        )
         df.dropna(inplace=True)
-        
+
         return df
     
     def get_dynamic_midprice(self, data: pd.DataFrame, method: str = 'ma_20') -> float:
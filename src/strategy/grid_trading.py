@@ -9,6 +9,48 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; fall back to the searchsorted path
+    njit = None
+
+
+def _grid_signals_kernel(lows: np.ndarray, highs: np.ndarray, levels: np.ndarray) -> np.ndarray:
+    """Signal kernel: 1 where any grid level falls inside the candle range
+
+    A candle [low, high] crosses the grid iff a binary search for the two
+    bounds lands on different indices, so the whole pass is two searchsorted
+    calls in C instead of an N x M Python scan. `levels` must be sorted.
+    """
+    lo_idx = np.searchsorted(levels, lows, side='left')
+    hi_idx = np.searchsorted(levels, highs, side='right')
+    return (hi_idx > lo_idx).astype(np.int8)
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _grid_signals_numba(lows, highs, levels):  # pragma: no cover
+        """Compiled kernel for parameter sweeps: prange over candles, binary
+        search per candle, no allocations beyond the output buffer"""
+        n = lows.shape[0]
+        m = levels.shape[0]
+        out = np.zeros(n, dtype=np.int8)
+        for i in prange(n):
+            lo = lows[i]
+            hi = highs[i]
+            left, right = 0, m
+            while left < right:
+                mid = (left + right) >> 1
+                if levels[mid] < lo:
+                    left = mid + 1
+                else:
+                    right = mid
+            if left < m and levels[left] <= hi:
+                out[i] = 1
+        return out
+else:
+    _grid_signals_numba = None
+
 
 class GridGenerator:
     """Generates and manages trading grids"""
@@ -31,21 +73,47 @@ class GridGenerator:
         """Generate symmetric grid levels around midprice"""
         start = self.midprice - self.grid_range
         end = self.midprice + self.grid_range
-        grid = np.arange(start, end + self.grid_distance, self.grid_distance)
-        
+
+        # linspace with an exact count keeps spacing uniform and endpoints
+        # exact, unlike arange + post-thinning which drifts and unevens the grid
+        n_levels = max(2, int(round(2 * self.grid_range / self.grid_distance)) + 1)
+
         # Limit number of grid levels for performance (max 1000)
-        if len(grid) > 1000:
-            logger.warning(f"Grid has {len(grid)} levels (>1000). Consider increasing grid_distance or reducing grid_range.")
-            # Keep only every nth level to reduce to ~500 levels
-            step = max(1, len(grid) // 500)
-            grid = grid[::step]
-            
+        if n_levels > 1000:
+            n_levels = 500
+            self.effective_distance = 2 * self.grid_range / (n_levels - 1)
+            logger.warning(f"Grid would exceed 1000 levels; capped at {n_levels} "
+                           f"(effective grid_distance: {self.effective_distance:.6f}). "
+                           f"Consider increasing grid_distance or reducing grid_range.")
+        else:
+            self.effective_distance = self.grid_distance
+
+        # float32 halves the grid's footprint (and Plotly's serialized payload)
+        # without losing meaningful price resolution
+        grid = np.linspace(start, end, n_levels, dtype=np.float32)
         logger.info(f"Generated grid with {len(grid)} levels from {start:.4f} to {end:.4f}")
         return grid
     
     def get_grid_levels(self) -> np.ndarray:
-        """Return grid levels"""
+        """Return grid levels (sorted ascending - linspace keeps the invariant)"""
         return self.grid_levels
+
+    def count_between(self, lo, hi) -> np.ndarray:
+        """
+        Count grid levels inside each [lo, hi] interval
+
+        Two binary searches on the sorted grid answer the range query, so
+        "was any level crossed" is simply count_between(low, high) > 0.
+
+        Args:
+            lo: Scalar or array of interval lower bounds
+            hi: Scalar or array of interval upper bounds
+
+        Returns:
+            np.ndarray: Number of grid levels in each interval
+        """
+        return (np.searchsorted(self.grid_levels, hi, side='right')
+                - np.searchsorted(self.grid_levels, lo, side='left'))
     
     def update_midprice(self, new_midprice: float):
         """Update midprice and regenerate grid"""
@@ -64,31 +132,37 @@ class GridSignalGenerator:
         Args:
             grid_levels: Array of grid price levels
         """
+        self.set_levels(grid_levels)
+
+    def set_levels(self, grid_levels: np.ndarray):
+        """Replace the grid levels and refresh the sorted search cache"""
         self.grid_levels = grid_levels
+        # Sort once here so every generate_signals call can binary-search;
+        # float32 to match the candle arrays and avoid promotion on compare
+        self._grid_sorted = np.sort(np.asarray(grid_levels, dtype=np.float32))
         
-    def generate_signals(self, data: pd.DataFrame) -> List[int]:
+    def generate_signals(self, data: pd.DataFrame) -> np.ndarray:
         """
         Generate trading signals when price crosses grid levels
-        
+
         Args:
             data: OHLCV dataframe
-            
+
         Returns:
-            List[int]: Signal array (1 for signal, 0 for no signal)
+            np.ndarray: int8 signal array (1 for signal, 0 for no signal)
         """
-        signals = [0] * len(data)
-        
-        for i, (index, row) in enumerate(data.iterrows()):
-            # Check if any grid level is crossed by the candle
-            candle_low = min(row.Low, row.High)
-            candle_high = max(row.Low, row.High)
-            
-            for grid_level in self.grid_levels:
-                if candle_low <= grid_level <= candle_high:
-                    signals[i] = 1
-                    break  # One signal per candle is enough
-                    
-        logger.info(f"Generated {sum(signals)} signals out of {len(signals)} candles")
+        # Low <= High holds for OHLC data, so the column views are used as-is
+        # with no defensive per-element min/max pass; float32 matches the
+        # grid dtype so searchsorted runs without promoting either side
+        candle_low = data['Low'].to_numpy(dtype=np.float32, copy=False)
+        candle_high = data['High'].to_numpy(dtype=np.float32, copy=False)
+
+        kernel = _grid_signals_numba if _grid_signals_numba is not None else _grid_signals_kernel
+        signals = kernel(candle_low, candle_high, self._grid_sorted)
+
+        logger.info(f"Generated {int(signals.sum())} signals out of {len(signals)} candles")
+        # int8 stays int8 when assigned as a column - 1 byte/candle, and
+        # downstream signal == 1 masks touch 8x less memory than int64
         return signals
     
     def add_signals_to_data(self, data: pd.DataFrame) -> pd.DataFrame:
@@ -101,9 +175,8 @@ class GridSignalGenerator:
         Returns:
             pd.DataFrame: Data with signals column
         """
-        df = data.copy()
-        df['signal'] = self.generate_signals(df)
-        return df
+        # assign() shares the OHLCV blocks; only the signal column is new
+        return data.assign(signal=self.generate_signals(data))
 
 
 class GridTradingStrategy:
@@ -129,6 +202,9 @@ class GridTradingStrategy:
         self.signal_generator = GridSignalGenerator(self.grid_generator.get_grid_levels())
         self.atr_multiplier = atr_multiplier
         self.tp_sl_ratio = tp_sl_ratio
+        # (key, signals) memo so repeated prepare_data calls on the same
+        # data + grid (e.g. Streamlit reruns) skip the signal pass
+        self._signal_cache = None
         
     def prepare_data(self, data: pd.DataFrame, use_dynamic_midprice: bool = False) -> pd.DataFrame:
         """
@@ -141,17 +217,33 @@ class GridTradingStrategy:
         Returns:
             pd.DataFrame: Prepared data with signals
         """
-        df = data.copy()
-        
         # Update midprice if dynamic pricing is enabled
-        if use_dynamic_midprice and 'MA_20' in df.columns:
-            new_midprice = df['MA_20'].iloc[-1]
+        if use_dynamic_midprice and 'MA_20' in data.columns:
+            new_midprice = data['MA_20'].iloc[-1]
             self.grid_generator.update_midprice(new_midprice)
-            self.signal_generator = GridSignalGenerator(self.grid_generator.get_grid_levels())
-        
-        # Add signals
-        df = self.signal_generator.add_signals_to_data(df)
-        
+            self.signal_generator.set_levels(self.grid_generator.get_grid_levels())
+
+        # Content-bearing fingerprint of data + grid: index span plus one
+        # vectorized reduction over each candle-bound column, so a different
+        # frame with the same shape can't alias a stale entry (id() can be
+        # recycled by the allocator). Midprice in the key also covers
+        # dynamic-midprice updates
+        lows = data['Low'].to_numpy(dtype=np.float32, copy=False)
+        highs = data['High'].to_numpy(dtype=np.float32, copy=False)
+        cache_key = (len(data), data.index[0], data.index[-1],
+                     float(lows.sum()), float(highs.sum()),
+                     self.grid_generator.midprice,
+                     self.grid_generator.grid_distance,
+                     self.grid_generator.grid_range)
+
+        if self._signal_cache is not None and self._signal_cache[0] == cache_key:
+            return data.assign(signal=self._signal_cache[1])
+
+        # Add signals; assign() inside shares the OHLCV blocks instead of
+        # deep-copying the whole frame, only the signal column is allocated
+        df = self.signal_generator.add_signals_to_data(data)
+        self._signal_cache = (cache_key, df['signal'].to_numpy())
+
         return df
     
     def get_strategy_parameters(self) -> dict:
@@ -168,8 +260,53 @@ class GridTradingStrategy:
     def get_grid_info(self) -> dict:
         """Return grid information for visualization"""
         return {
-            'levels': self.grid_generator.get_grid_levels().tolist(),
+            'levels': self.grid_generator.get_grid_levels(),
             'midprice': self.grid_generator.midprice,
             'range': self.grid_generator.grid_range,
             'distance': self.grid_generator.grid_distance
         }
+
+
+# --- Parameter sweeps -------------------------------------------------------
+
+# OHLCV frame shared with sweep workers via the pool initializer, so the
+# (potentially large) data is pickled once per worker instead of once per task
+_SWEEP_DATA = None
+
+
+def _sweep_init(data: pd.DataFrame):
+    global _SWEEP_DATA
+    _SWEEP_DATA = data
+
+
+def _sweep_run(params: dict) -> Tuple[dict, pd.DataFrame]:
+    strategy = GridTradingStrategy(
+        midprice=params['midprice'],
+        grid_distance=params['grid_distance'],
+        grid_range=params['grid_range'],
+        atr_multiplier=params.get('atr_multiplier', 1.5),
+        tp_sl_ratio=params.get('tp_sl_ratio', 0.5)
+    )
+    return params, strategy.prepare_data(_SWEEP_DATA)
+
+
+def run_sweep(data: pd.DataFrame, param_grid, n_workers: int = None):
+    """
+    Prepare signal data for many parameter combinations in parallel
+
+    Args:
+        data: OHLCV dataframe with technical indicators
+        param_grid: Iterable of parameter dicts (midprice, grid_distance,
+            grid_range, optionally atr_multiplier / tp_sl_ratio)
+        n_workers: Worker processes (default: number of CPUs)
+
+    Yields:
+        Tuple[dict, pd.DataFrame]: (params, prepared data) as runs complete
+    """
+    import os
+    from multiprocessing import Pool
+
+    params_list = list(param_grid)
+    with Pool(processes=n_workers or os.cpu_count(),
+              initializer=_sweep_init, initargs=(data,)) as pool:
+        yield from pool.imap_unordered(_sweep_run, params_list)
@@ -2,6 +2,13 @@
 Visualization and charting modules
 """
 
-from .charts import GridTradingVisualizer, display_metrics_cards, display_strategy_parameters
-
 __all__ = ['GridTradingVisualizer', 'display_metrics_cards', 'display_strategy_parameters']
+
+
+def __getattr__(name):
+    # PEP 562 lazy loading: importing the package stays free of plotly /
+    # streamlit until a chart helper is actually requested
+    if name in __all__:
+        from . import charts
+        return getattr(charts, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,12 +3,12 @@ Visualization module for Grid Trading Strategy
 """
 
 import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional
-import streamlit as st
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class GridTradingVisualizer:
@@ -41,8 +41,21 @@ class GridTradingVisualizer:
         Returns:
             plotly.graph_objects.Figure: Interactive chart
         """
+        # Downsample long histories: beyond a few thousand candles the browser
+        # render and JSON payload dominate, not the extra visual detail
+        max_candles = 5000
+        if len(data) > max_candles:
+            step = int(np.ceil(len(data) / max_candles))
+            agg = {'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last'}
+            if 'signal' in data.columns:
+                agg['signal'] = 'max'
+            downsampled = data.groupby(np.arange(len(data)) // step).agg(agg)
+            downsampled.index = data.index[::step]
+            logger.info(f"Displaying {len(downsampled)} aggregated candles out of {len(data)} for responsiveness")
+            data = downsampled
+
         fig = go.Figure()
-        
+
         # Add candlestick chart
         fig.add_trace(go.Candlestick(
             x=data.index,
@@ -61,26 +74,37 @@ class GridTradingVisualizer:
             # Display only every nth level to avoid clutter
             step = max(1, len(grid_levels) // max_grid_display)
             display_levels = grid_levels[::step]
-            st.info(f"Displaying {len(display_levels)} out of {len(grid_levels)} grid levels for clarity")
+            logger.info(f"Displaying {len(display_levels)} out of {len(grid_levels)} grid levels for clarity")
         else:
             display_levels = grid_levels
             
-        for level in display_levels:
-            fig.add_hline(
-                y=level, 
-                line_dash="dash", 
-                line_color=self.colors['grid'],
-                line_width=1,
-                opacity=0.6
-            )
+        # One Scatter trace with NaN-separated segments draws every grid line
+        # at once; per-level add_hline calls rebuild the layout dict each time
+        if len(display_levels) > 0:
+            x_min, x_max = data.index[0], data.index[-1]
+            levels_arr = np.asarray(display_levels, dtype=float)
+            xs = np.tile(np.array([x_min, x_max, None], dtype=object), len(levels_arr))
+            ys = np.repeat(levels_arr, 3)
+            ys[2::3] = np.nan
+            fig.add_trace(go.Scatter(
+                x=xs,
+                y=ys,
+                mode='lines',
+                line=dict(color=self.colors['grid'], width=1, dash='dash'),
+                opacity=0.6,
+                hoverinfo='skip',
+                showlegend=False,
+                name='Grid'
+            ))
         
-        # Add signals if available
+        # Add signals if available (mask the two needed arrays directly
+        # instead of materializing a filtered sub-DataFrame)
         if 'signal' in data.columns:
-            signal_points = data[data['signal'] == 1]
-            if not signal_points.empty:
+            mask = data['signal'].to_numpy() == 1
+            if mask.any():
                 fig.add_trace(go.Scatter(
-                    x=signal_points.index,
-                    y=signal_points['Close'],
+                    x=data.index.values[mask],
+                    y=data['Close'].to_numpy()[mask],
                     mode='markers',
                     marker=dict(
                         color=self.colors['signal'],
@@ -194,23 +218,20 @@ class GridTradingVisualizer:
         Returns:
             plotly.graph_objects.Figure: Performance summary chart
         """
-        # Extract numeric values
-        metrics_to_plot = {
-            'Total Return': metrics.get('total_return_value', 0),
-            'Sharpe Ratio': float(metrics.get('sharpe_ratio', '0').replace('%', '')),
-            'Max Drawdown': -abs(metrics.get('max_drawdown_value', 0)),
-            'Win Rate': metrics.get('win_rate_value', 0)
-        }
-        
+        # Use the numeric *_value siblings directly - no string re-parsing
+        labels = ['Total Return', 'Sharpe Ratio', 'Max Drawdown', 'Win Rate']
+        values = [
+            metrics.get('total_return_value', 0),
+            metrics.get('sharpe_ratio_value', 0.0),
+            -abs(metrics.get('max_drawdown_value', 0)),
+            metrics.get('win_rate_value', 0)
+        ]
+
+        colors = np.where(np.asarray(values) > 0,
+                          self.colors['success'], self.colors['danger']).tolist()
+
         fig = go.Figure(data=[
-            go.Bar(
-                x=list(metrics_to_plot.keys()),
-                y=list(metrics_to_plot.values()),
-                marker_color=[
-                    self.colors['success'] if v > 0 else self.colors['danger'] 
-                    for v in metrics_to_plot.values()
-                ]
-            )
+            go.Bar(x=labels, y=values, marker_color=colors)
         ])
         
         fig.update_layout(
@@ -237,11 +258,17 @@ class GridTradingVisualizer:
         
         # Calculate return percentages
         returns = trades_df['ReturnPct'].dropna()
-        
+
+        # Bin server-side: the payload is 20 bars instead of every trade,
+        # and the browser no longer histograms the raw returns itself
+        counts, edges = np.histogram(returns.to_numpy(), bins=20)
+        centers = 0.5 * (edges[:-1] + edges[1:])
+
         fig = go.Figure(data=[
-            go.Histogram(
-                x=returns,
-                nbinsx=20,
+            go.Bar(
+                x=centers,
+                y=counts,
+                width=np.diff(edges),
                 marker_color=self.colors['info'],
                 opacity=0.7
             )
@@ -265,6 +292,8 @@ def display_metrics_cards(metrics: Dict):
     Args:
         metrics: Performance metrics dictionary
     """
+    import streamlit as st
+
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
@@ -323,6 +352,8 @@ def display_strategy_parameters(params: Dict):
     Args:
         params: Strategy parameters dictionary
     """
+    import streamlit as st
+
     st.subheader("Strategy Parameters")
     
     col1, col2 = st.columns(2)
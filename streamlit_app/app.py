@@ -4,19 +4,20 @@ Streamlit application for Grid Trading Strategy Backtester
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import sys
 import os
-from datetime import datetime, timedelta
+from datetime import datetime, date, timedelta
 import logging
 
 # Add src to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'config'))
 
+# Plotly (visualization.charts) and backtesting.py (backtest.backtester) are
+# imported lazily inside the functions that need them to keep cold start lean
 from data.fetcher import DataFetcher
 from strategy.grid_trading import GridTradingStrategy
-from backtest.backtester import GridBacktester
-from visualization.charts import GridTradingVisualizer, display_metrics_cards, display_strategy_parameters
 from settings import SUPPORTED_ASSETS, TradingConfig, DataConfig, STREAMLIT_CONFIG
 
 # Configure logging
@@ -32,6 +33,180 @@ st.set_page_config(
 )
 
 
+@st.cache_resource(show_spinner=False)
+def _viz():
+    """Shared GridTradingVisualizer instance; built once per process instead
+    of on every rerun (this is also what pulls in Plotly, lazily)"""
+    from visualization.charts import GridTradingVisualizer
+    return GridTradingVisualizer()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_fetcher() -> DataFetcher:
+    """Process-wide DataFetcher singleton, so the yfinance HTTP session and
+    in-process download caches survive across user sessions and reruns"""
+    return DataFetcher()
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_market_data(symbol: str, start_date: str, end_date: str, interval: str) -> pd.DataFrame:
+    """Fetch OHLCV data, cached per (symbol, dates, interval) for an hour"""
+    return _get_fetcher().fetch_data(symbol, start_date, end_date, interval)
+
+
+@st.cache_data(show_spinner=False)
+def compute_indicators(raw_data: pd.DataFrame) -> pd.DataFrame:
+    """Add technical indicators, cached on the dataframe contents"""
+    return _get_fetcher().add_technical_indicators(raw_data)
+
+
+def _df_fingerprint(df: pd.DataFrame) -> int:
+    """Cache key for DataFrames passed to the cached helpers below
+
+    The prepared frame reuses the hash computed once per load (stored in
+    session_state) instead of being rehashed on every call; any other frame
+    (e.g. the trades table) gets a vectorized row hash on the spot.
+    """
+    if df is st.session_state.get('prepared_data') and 'prepared_data_hash' in st.session_state:
+        return st.session_state.prepared_data_hash
+    return int(pd.util.hash_pandas_object(df).sum())
+
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: _df_fingerprint})
+def _data_summary(prepared_data: pd.DataFrame) -> dict:
+    """Data summary memoized on the shared frame fingerprint, so both steps
+    reuse one min/max/current scan per dataset"""
+    return _get_fetcher().get_data_summary(prepared_data)
+
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: _df_fingerprint})
+def _to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """CSV serialization for the download buttons, cached per frame contents
+    (one vectorized row hash) so the multi-MB string is built once"""
+    return df.to_csv().encode()
+
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: _df_fingerprint})
+def _price_chart(prepared_data: pd.DataFrame, levels: tuple, title: str):
+    """Price-with-grid figure cached on (data index, levels, title); tweaking
+    unrelated widgets replays the cached figure instead of rebuilding it"""
+    return _viz().plot_price_with_grid(
+        prepared_data, np.asarray(levels, dtype=np.float32), title)
+
+
+@st.fragment
+def _grid_sidebar():
+    """Step 1 sidebar: widget tweaks rerun only this fragment, not the
+    main-area tables and charts"""
+    with st.sidebar:
+        st.header("⚙️ Data & Grid Configuration")
+
+        # Asset selection
+        st.subheader("📈 Asset Selection")
+        selected_symbol = st.selectbox(
+            "Choose Asset:",
+            options=list(SUPPORTED_ASSETS.keys()),
+            format_func=lambda x: f"{SUPPORTED_ASSETS[x]['name']} ({x})"
+        )
+
+        asset_info = SUPPORTED_ASSETS[selected_symbol]
+
+        # Date range: one native range widget instead of two inputs in a
+        # two-column row - one less container and widget on every rerun
+        st.subheader("📅 Date Range")
+        date_range = st.date_input(
+            "Date Range:",
+            value=(date(2024, 1, 1), date(2024, 12, 31)),
+            max_value=datetime.now().date()
+        )
+        # Mid-selection the widget returns a single date
+        start_date = date_range[0]
+        end_date = date_range[1] if len(date_range) > 1 else date_range[0]
+
+        interval = st.selectbox(
+            "Data Interval:",
+            options=['1d', '1h', '5m', '15m', '30m'],
+            index=0,  # Default to daily
+            help="Daily data is recommended for longer backtests"
+        )
+
+        # Grid parameters
+        st.subheader("🎯 Grid Configuration")
+
+        use_dynamic_midprice = st.checkbox(
+            "Use Dynamic Midprice (MA-20)",
+            value=False,
+            help="Use 20-period moving average instead of fixed midprice"
+        )
+
+        if not use_dynamic_midprice:
+            midprice = st.number_input(
+                "Midprice:",
+                value=float(asset_info['midprice']),
+                min_value=0.0,
+                step=0.001,
+                format="%.6f",
+                help="Center price around which the grid is built"
+            )
+        else:
+            midprice = asset_info['midprice']  # Will be updated dynamically
+            st.info(f"Dynamic midprice will be calculated from data (preview: ~{asset_info['midprice']})")
+
+        grid_distance = st.number_input(
+            "Grid Distance:",
+            value=float(asset_info['grid_distance']),
+            min_value=0.0001,
+            step=0.0001,
+            format="%.6f",
+            help="Distance between grid levels"
+        )
+
+        # Calculate appropriate max_value based on asset type
+        default_grid_range = float(asset_info.get('grid_range', 50.0))
+        max_grid_range = max(100000.0, default_grid_range * 5)  # At least 5x the default or 100k
+
+        grid_range = st.number_input(
+            "Grid Range:",
+            value=default_grid_range,
+            min_value=0.001,
+            max_value=max_grid_range,
+            step=0.001,
+            format="%.6f",
+            help="Total range of the grid (up and down from midprice)"
+        )
+
+        # Grid validation warning
+        estimated_levels = int((2 * grid_range) / grid_distance)
+        if estimated_levels > 1000:
+            st.error(f"⚠️ Warning: This configuration will generate ~{estimated_levels:,} grid levels. "
+                    f"This may cause performance issues. Consider:")
+            st.markdown("- Increasing Grid Distance (fewer levels)")
+            st.markdown("- Reducing Grid Range (smaller area)")
+            st.markdown("- Recommended: < 1000 levels for optimal performance")
+        elif estimated_levels > 500:
+            st.warning(f"⚠️ This will generate ~{estimated_levels:,} grid levels. "
+                      f"Consider adjusting parameters for better performance.")
+        else:
+            st.success(f"✅ Grid will have ~{estimated_levels:,} levels (optimal range)")
+
+        st.session_state.grid_params = {
+            'symbol': selected_symbol,
+            'start_date': start_date,
+            'end_date': end_date,
+            'interval': interval,
+            'use_dynamic_midprice': use_dynamic_midprice,
+            'midprice': midprice,
+            'grid_distance': grid_distance,
+            'grid_range': grid_range,
+        }
+
+        # Load data and generate grid button; loading changes the whole page,
+        # so escape the fragment with a full-app rerun
+        if st.button("📊 Load Data & Generate Grid", type="primary"):
+            st.session_state.load_data_requested = True
+            st.rerun()
+
+
 def main():
     """Main Streamlit application"""
     
@@ -47,21 +222,16 @@ def main():
         st.session_state.strategy = None
     if 'data_fetcher' not in st.session_state:
         st.session_state.data_fetcher = None
+    if 'backtester' not in st.session_state:
+        st.session_state.backtester = None
     
-    # Progress indicator
-    progress_col1, progress_col2 = st.columns(2)
-    with progress_col1:
-        if st.session_state.step >= 1:
-            st.success("✅ 1. Data & Grid Configuration")
-        else:
-            st.info("⏳ 1. Data & Grid Configuration")
-    
-    with progress_col2:
-        if st.session_state.step >= 2:
-            st.success("✅ 2. Backtesting & Risk Management")
-        else:
-            st.info("⏳ 2. Backtesting & Risk Management")
-    
+    # Progress indicator: a single progress bar instead of a two-column row
+    # of status boxes rebuilt on every rerun
+    if st.session_state.step >= 2:
+        st.progress(1.0, text="✅ 2. Backtesting & Risk Management")
+    else:
+        st.progress(0.5, text="⏳ 1. Data & Grid Configuration")
+
     st.markdown("---")
     
     # STEP 1: Data Loading and Grid Configuration
@@ -69,124 +239,39 @@ def main():
         st.header("📊 Step 1: Data Loading & Grid Configuration")
         st.markdown("Configure your asset, time period, and grid parameters to visualize the trading signals.")
         
-        # Sidebar for Step 1 parameters
-        with st.sidebar:
-            st.header("⚙️ Data & Grid Configuration")
-            
-            # Asset selection
-            st.subheader("📈 Asset Selection")
-            selected_symbol = st.selectbox(
-                "Choose Asset:",
-                options=list(SUPPORTED_ASSETS.keys()),
-                format_func=lambda x: f"{SUPPORTED_ASSETS[x]['name']} ({x})"
-            )
-            
-            asset_info = SUPPORTED_ASSETS[selected_symbol]
-            
-            # Date range
-            st.subheader("📅 Date Range")
-            col1, col2 = st.columns(2)
-            with col1:
-                start_date = st.date_input(
-                    "Start Date:",
-                    value=datetime.strptime("2024-01-01", "%Y-%m-%d").date(),
-                    max_value=datetime.now().date()
-                )
-            with col2:
-                end_date = st.date_input(
-                    "End Date:",
-                    value=datetime.strptime("2024-12-31", "%Y-%m-%d").date(),
-                    max_value=datetime.now().date()
-                )
-            
-            interval = st.selectbox(
-                "Data Interval:",
-                options=['1d', '1h', '5m', '15m', '30m'],
-                index=0,  # Default to daily
-                help="Daily data is recommended for longer backtests"
-            )
-            
-            # Grid parameters
-            st.subheader("🎯 Grid Configuration")
-            
-            use_dynamic_midprice = st.checkbox(
-                "Use Dynamic Midprice (MA-20)",
-                value=False,
-                help="Use 20-period moving average instead of fixed midprice"
-            )
-            
-            if not use_dynamic_midprice:
-                midprice = st.number_input(
-                    "Midprice:",
-                    value=float(asset_info['midprice']),
-                    min_value=0.0,
-                    step=0.001,
-                    format="%.6f",
-                    help="Center price around which the grid is built"
-                )
-            else:
-                midprice = asset_info['midprice']  # Will be updated dynamically
-                st.info(f"Dynamic midprice will be calculated from data (preview: ~{asset_info['midprice']})")
-            
-            grid_distance = st.number_input(
-                "Grid Distance:",
-                value=float(asset_info['grid_distance']),
-                min_value=0.0001,
-                step=0.0001,
-                format="%.6f",
-                help="Distance between grid levels"
-            )
-            
-            # Calculate appropriate max_value based on asset type
-            default_grid_range = float(asset_info.get('grid_range', 50.0))
-            max_grid_range = max(100000.0, default_grid_range * 5)  # At least 5x the default or 100k
-            
-            grid_range = st.number_input(
-                "Grid Range:",
-                value=default_grid_range,
-                min_value=0.001,
-                max_value=max_grid_range,
-                step=0.001,
-                format="%.6f",
-                help="Total range of the grid (up and down from midprice)"
-            )
-            
-            # Grid validation warning
-            estimated_levels = int((2 * grid_range) / grid_distance)
-            if estimated_levels > 1000:
-                st.error(f"⚠️ Warning: This configuration will generate ~{estimated_levels:,} grid levels. "
-                        f"This may cause performance issues. Consider:")
-                st.markdown("- Increasing Grid Distance (fewer levels)")
-                st.markdown("- Reducing Grid Range (smaller area)")
-                st.markdown("- Recommended: < 1000 levels for optimal performance")
-            elif estimated_levels > 500:
-                st.warning(f"⚠️ This will generate ~{estimated_levels:,} grid levels. "
-                          f"Consider adjusting parameters for better performance.")
-            else:
-                st.success(f"✅ Grid will have ~{estimated_levels:,} levels (optimal range)")
-            
-            # Load data and generate grid button
-            load_data_btn = st.button("📊 Load Data & Generate Grid", type="primary")
-        
+        # Sidebar for Step 1 parameters (fragment-isolated)
+        _grid_sidebar()
+
+        params = st.session_state.grid_params
+        selected_symbol = params['symbol']
+        asset_info = SUPPORTED_ASSETS[selected_symbol]
+        start_date = params['start_date']
+        end_date = params['end_date']
+        interval = params['interval']
+        use_dynamic_midprice = params['use_dynamic_midprice']
+        midprice = params['midprice']
+        grid_distance = params['grid_distance']
+        grid_range = params['grid_range']
+
         # Main area for Step 1
-        if load_data_btn:
+        if st.session_state.pop('load_data_requested', False):
             with st.spinner("Loading data and generating grid..."):
                 try:
                     # Initialize components
-                    st.session_state.data_fetcher = DataFetcher()
-                    visualizer = GridTradingVisualizer()
-                    
-                    # Fetch data
+                    st.session_state.data_fetcher = _get_fetcher()
+
+                    # Fetch data (st.cache_data skips the network + indicator
+                    # recomputation when only grid parameters changed)
                     st.info(f"Fetching {asset_info['name']} data...")
-                    raw_data = st.session_state.data_fetcher.fetch_data(
-                        symbol=selected_symbol,
-                        start_date=start_date.strftime("%Y-%m-%d"),
-                        end_date=end_date.strftime("%Y-%m-%d"),
-                        interval=interval
+                    raw_data = fetch_market_data(
+                        selected_symbol,
+                        start_date.strftime("%Y-%m-%d"),
+                        end_date.strftime("%Y-%m-%d"),
+                        interval
                     )
-                    
+
                     # Add technical indicators
-                    data_with_indicators = st.session_state.data_fetcher.add_technical_indicators(raw_data)
+                    data_with_indicators = compute_indicators(raw_data)
                     
                     # Get dynamic midprice if enabled
                     if use_dynamic_midprice:
@@ -202,10 +287,19 @@ def main():
                     
                     # Prepare data with signals
                     st.session_state.prepared_data = st.session_state.strategy.prepare_data(
-                        data_with_indicators, 
+                        data_with_indicators,
                         use_dynamic_midprice=use_dynamic_midprice
                     )
-                    
+
+                    # Hash once per load; every cached helper keys off this via
+                    # _df_fingerprint instead of rehashing the frame per call.
+                    # The signal column is folded in so a new grid on the same
+                    # dates still invalidates the caches.
+                    st.session_state.prepared_data_hash = (
+                        int(pd.util.hash_pandas_object(st.session_state.prepared_data.index).sum())
+                        ^ int(pd.util.hash_pandas_object(st.session_state.prepared_data['signal']).sum())
+                    )
+
                     st.success("✅ Data loaded and grid generated successfully!")
                     
                 except Exception as e:
@@ -214,10 +308,18 @@ def main():
         
         # Display results if data is loaded
         if st.session_state.prepared_data is not None and st.session_state.strategy is not None:
-            
+
             # Data summary
-            data_summary = st.session_state.data_fetcher.get_data_summary(st.session_state.prepared_data)
-            
+            data_summary = _data_summary(st.session_state.prepared_data)
+
+            # One numpy scan of the int8 signal column; reused by the metric
+            # card, the expander and the signal-analysis line below
+            signals_count = int(st.session_state.prepared_data['signal'].to_numpy().sum())
+
+            # The generated grid itself (ndarray of levels); bound once and
+            # reused by the expander and the chart
+            grid_info = st.session_state.strategy.get_grid_info()
+
             col1, col2, col3, col4 = st.columns(4)
             with col1:
                 st.metric("Data Points", data_summary['rows'])
@@ -226,7 +328,7 @@ def main():
             with col3:
                 st.metric("Current Price", f"{data_summary['price_range']['current']:.2f}")
             with col4:
-                st.metric("Trading Signals", st.session_state.prepared_data['signal'].sum())
+                st.metric("Trading Signals", signals_count)
             
             # Strategy parameters
             strategy_info = st.session_state.strategy.get_strategy_parameters()
@@ -238,24 +340,26 @@ def main():
                     st.write(f"**Grid Range:** {strategy_info['grid_range']}")
                 with col2:
                     st.write(f"**Grid Levels:** {strategy_info['grid_levels_count']}")
-                    st.write(f"**Signals Generated:** {st.session_state.prepared_data['signal'].sum()}")
-                    grid_info = st.session_state.strategy.get_grid_info()
-                    st.write(f"**Level Range:** {min(grid_info['levels']):.4f} - {max(grid_info['levels']):.4f}")
+                    st.write(f"**Signals Generated:** {signals_count}")
+                    levels = grid_info['levels']
+                    st.write(f"**Level Range:** {levels.min():.4f} - {levels.max():.4f}")
             
             # Price chart with grid and signals
             st.subheader("📈 Price Chart with Grid Levels & Trading Signals")
             
-            visualizer = GridTradingVisualizer()
-            grid_info = st.session_state.strategy.get_grid_info()
-            price_chart = visualizer.plot_price_with_grid(
+            price_chart = _price_chart(
                 st.session_state.prepared_data,
-                grid_info['levels'],
+                tuple(float(level) for level in grid_info['levels']),
                 f"{asset_info['name']} Price with Grid Levels"
             )
             st.plotly_chart(price_chart, use_container_width=True)
-            
+
+            # The chart builder downsamples long histories (the UI notice
+            # lives here; the builder itself only logs)
+            if len(st.session_state.prepared_data) > 5000:
+                st.caption(f"Chart shows aggregated candles ({len(st.session_state.prepared_data):,} bars downsampled for responsiveness)")
+
             # Signal analysis
-            signals_count = st.session_state.prepared_data['signal'].sum()
             total_candles = len(st.session_state.prepared_data)
             signal_frequency = (signals_count / total_candles * 100) if total_candles > 0 else 0
             
@@ -364,54 +468,56 @@ def main():
                 format="%.4f",
                 help="Commission as fraction of trade value"
             )
-            
-            # Run backtest button
-            run_backtest = st.button("🚀 Run Backtest", type="primary")
-        
+
         # Main area for Step 2
         # Show summary of Step 1 configuration
         with st.expander("📋 Grid Configuration Summary (Step 1)", expanded=False):
             strategy_info = st.session_state.strategy.get_strategy_parameters()
-            data_summary = st.session_state.data_fetcher.get_data_summary(st.session_state.prepared_data)
+            data_summary = _data_summary(st.session_state.prepared_data)
             
+            # One markdown payload per column instead of one st.write per line
             col1, col2, col3 = st.columns(3)
-            with col1:
-                st.write("**Data:**")
-                st.write(f"• Points: {data_summary['rows']}")
-                st.write(f"• Signals: {st.session_state.prepared_data['signal'].sum()}")
-            with col2:
-                st.write("**Grid:**")
-                st.write(f"• Midprice: {strategy_info['midprice']}")
-                st.write(f"• Distance: {strategy_info['grid_distance']}")
-                st.write(f"• Levels: {strategy_info['grid_levels_count']}")
-            with col3:
-                st.write("**Price Range:**")
-                st.write(f"• Min: {data_summary['price_range']['min']:.2f}")
-                st.write(f"• Max: {data_summary['price_range']['max']:.2f}")
-                st.write(f"• Current: {data_summary['price_range']['current']:.2f}")
+            col1.markdown(
+                f"**Data:**\n\n"
+                f"- Points: {data_summary['rows']}\n"
+                f"- Signals: {int(st.session_state.prepared_data['signal'].to_numpy().sum())}"
+            )
+            col2.markdown(
+                f"**Grid:**\n\n"
+                f"- Midprice: {strategy_info['midprice']}\n"
+                f"- Distance: {strategy_info['grid_distance']}\n"
+                f"- Levels: {strategy_info['grid_levels_count']}"
+            )
+            col3.markdown(
+                f"**Price Range:**\n\n"
+                f"- Min: {data_summary['price_range']['min']:.2f}\n"
+                f"- Max: {data_summary['price_range']['max']:.2f}\n"
+                f"- Current: {data_summary['price_range']['current']:.2f}"
+            )
         
         # Backtesting preview
         st.subheader("🎯 Backtesting Configuration Preview")
         
+        # Calculate approximate risk per trade (strategy_info already bound
+        # once in the summary expander above)
+        approx_sl = strategy_info['grid_distance'] * atr_multiplier
+        risk_per_trade = position_size * approx_sl
+
         col1, col2 = st.columns(2)
-        with col1:
-            st.write("**Portfolio Settings:**")
-            st.write(f"• Initial Cash: ${cash:,}")
-            st.write(f"• Position Size: {position_size} units")
-            st.write(f"• Max Trades: {max_trades}")
-            st.write(f"• Margin: {margin*100:.1f}%")
-        
-        with col2:
-            st.write("**Risk Management:**")
-            st.write(f"• ATR Multiplier: {atr_multiplier}x")
-            st.write(f"• TP/SL Ratio: {tp_sl_ratio}")
-            st.write(f"• Commission: {commission*100:.2f}%")
-            
-            # Calculate approximate risk per trade
-            strategy_info = st.session_state.strategy.get_strategy_parameters()
-            approx_sl = strategy_info['grid_distance'] * atr_multiplier
-            risk_per_trade = position_size * approx_sl
-            st.write(f"• Est. Risk/Trade: ${risk_per_trade:.2f}")
+        col1.markdown(
+            f"**Portfolio Settings:**\n\n"
+            f"- Initial Cash: ${cash:,}\n"
+            f"- Position Size: {position_size} units\n"
+            f"- Max Trades: {max_trades}\n"
+            f"- Margin: {margin*100:.1f}%"
+        )
+        col2.markdown(
+            f"**Risk Management:**\n\n"
+            f"- ATR Multiplier: {atr_multiplier}x\n"
+            f"- TP/SL Ratio: {tp_sl_ratio}\n"
+            f"- Commission: {commission*100:.2f}%\n"
+            f"- Est. Risk/Trade: ${risk_per_trade:.2f}"
+        )
         
         # Risk warnings
         total_risk = max_trades * position_size * strategy_info['grid_distance'] * atr_multiplier
@@ -421,30 +527,17 @@ def main():
         if position_size * strategy_info['midprice'] > cash * 0.2:  # Single position > 20% of capital
             st.warning(f"⚠️ **Position Size Warning**: Single position value exceeds 20% of capital")
         
-        # Run backtest
-        if run_backtest:
-            with st.spinner("Running backtest..."):
-                try:
-                    # Strategy parameters for backtesting
-                    strategy_params = {
-                        'position_size': position_size,
-                        'atr_multiplier': atr_multiplier,
-                        'tp_sl_ratio': tp_sl_ratio,
-                        'max_trades': max_trades,
-                        'grid_distance': strategy_info['grid_distance']
-                    }
-                    
-                    backtester = GridBacktester(cash=cash, margin=margin)
-                    results = backtester.run_backtest(st.session_state.prepared_data, strategy_params)
-                    
-                    st.success("✅ Backtest completed successfully!")
-                    
-                    # Display results immediately after backtest
-                    display_backtest_results(backtester, st.session_state.data_fetcher, st.session_state.strategy)
-                    
-                except Exception as e:
-                    st.error(f"❌ Backtest failed: {str(e)}")
-        
+        # Run backtest (fragment-isolated: clicking the button reruns only
+        # the panel, not the whole Step 2 page)
+        strategy_params = {
+            'position_size': position_size,
+            'atr_multiplier': atr_multiplier,
+            'tp_sl_ratio': tp_sl_ratio,
+            'max_trades': max_trades,
+            'grid_distance': strategy_info['grid_distance']
+        }
+        _backtest_panel(strategy_params, cash, margin)
+
         # Navigation buttons
         col1, col2 = st.columns(2)
         with col1:
@@ -458,12 +551,43 @@ def main():
                 st.session_state.prepared_data = None
                 st.session_state.strategy = None
                 st.session_state.data_fetcher = None
+                st.session_state.backtester = None
                 st.rerun()
 
 
+@st.fragment
+def _backtest_panel(strategy_params: dict, cash: float, margin: float):
+    """Backtest run + results panel
+
+    Isolated in a fragment so clicking Run Backtest (or interacting with the
+    results) reruns only this panel; the backtester lives in session_state so
+    re-entering the panel shows the last results without re-running the backtest.
+    """
+    if st.button("🚀 Run Backtest", type="primary"):
+        with st.spinner("Running backtest..."):
+            try:
+                from backtest.backtester import GridBacktester
+
+                backtester = GridBacktester(cash=cash, margin=margin)
+                backtester.run_backtest(st.session_state.prepared_data, strategy_params)
+                st.session_state.backtester = backtester
+
+                st.success("✅ Backtest completed successfully!")
+
+            except Exception as e:
+                st.error(f"❌ Backtest failed: {str(e)}")
+                return
+
+    if st.session_state.backtester is not None:
+        display_backtest_results(st.session_state.backtester,
+                                 st.session_state.data_fetcher,
+                                 st.session_state.strategy)
+
+
 def display_backtest_results(backtester, data_fetcher, strategy):
     """Display comprehensive backtest results"""
-    
+    from visualization.charts import display_metrics_cards
+
     st.header("📊 Backtest Results")
     
     # Performance metrics
@@ -473,8 +597,8 @@ def display_backtest_results(backtester, data_fetcher, strategy):
     # Charts
     st.subheader("📈 Performance Charts")
     
-    visualizer = GridTradingVisualizer()
-    
+    visualizer = _viz()
+
     # Equity curve
     equity_data = backtester.get_equity_curve()
     equity_chart = visualizer.plot_equity_curve(equity_data)
@@ -494,22 +618,26 @@ def display_backtest_results(backtester, data_fetcher, strategy):
         with st.expander("📋 Detailed Trade Analysis"):
             st.subheader("Trade Statistics")
             
+            # One numpy array + two masks instead of two fancy-indexed
+            # DataFrame copies; the stats only need the return column
+            ret = trades_df['ReturnPct'].to_numpy()
+            wins = ret[ret > 0]
+            losses = ret[ret < 0]
+
             col1, col2 = st.columns(2)
             with col1:
                 st.write("**Winning Trades:**")
-                winning_trades = trades_df[trades_df['ReturnPct'] > 0]
-                if not winning_trades.empty:
-                    st.write(f"• Count: {len(winning_trades)}")
-                    st.write(f"• Average: {winning_trades['ReturnPct'].mean():.2f}%")
-                    st.write(f"• Best: {winning_trades['ReturnPct'].max():.2f}%")
-            
+                if wins.size:
+                    st.write(f"• Count: {wins.size}")
+                    st.write(f"• Average: {wins.mean():.2f}%")
+                    st.write(f"• Best: {wins.max():.2f}%")
+
             with col2:
                 st.write("**Losing Trades:**")
-                losing_trades = trades_df[trades_df['ReturnPct'] < 0]
-                if not losing_trades.empty:
-                    st.write(f"• Count: {len(losing_trades)}")
-                    st.write(f"• Average: {losing_trades['ReturnPct'].mean():.2f}%")
-                    st.write(f"• Worst: {losing_trades['ReturnPct'].min():.2f}%")
+                if losses.size:
+                    st.write(f"• Count: {losses.size}")
+                    st.write(f"• Average: {losses.mean():.2f}%")
+                    st.write(f"• Worst: {losses.min():.2f}%")
             
             st.subheader("Trade Details")
             st.dataframe(trades_df, use_container_width=True)
@@ -524,20 +652,18 @@ def display_backtest_results(backtester, data_fetcher, strategy):
     
     with col1:
         # Prepare data for download
-        results_csv = st.session_state.prepared_data.to_csv()
         st.download_button(
             label="📥 Download Price Data with Signals",
-            data=results_csv,
+            data=_to_csv_bytes(st.session_state.prepared_data),
             file_name=f"grid_trading_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
             mime="text/csv"
         )
     
     with col2:
         if not trades_df.empty:
-            trades_csv = trades_df.to_csv()
             st.download_button(
                 label="📥 Download Trade Details",
-                data=trades_csv,
+                data=_to_csv_bytes(trades_df),
                 file_name=f"grid_trading_trades_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
                 mime="text/csv"
             )
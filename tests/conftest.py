@@ -0,0 +1,10 @@
+"""
+Pytest configuration for the test suite
+"""
+
+import sys
+from pathlib import Path
+
+# Make the repository root importable once at collection time, instead of
+# every test module mutating sys.path on import
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
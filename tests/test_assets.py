@@ -0,0 +1,46 @@
+"""
+Smoke test of the data -> indicators -> signals pipeline across all assets
+"""
+
+import numpy as np
+import pytest
+
+from src.data.fetcher import DataFetcher
+from src.strategy.grid_trading import GridTradingStrategy
+from config.settings import SUPPORTED_ASSETS
+
+
+@pytest.fixture(scope="session")
+def shared_fetcher():
+    """One DataFetcher for the whole session, so every asset reuses the same
+    HTTP connection pool and in-process download cache"""
+    return DataFetcher()
+
+
+@pytest.mark.parametrize("symbol", list(SUPPORTED_ASSETS))
+def test_asset_pipeline(symbol, shared_fetcher):
+    """Each supported asset runs the full pipeline with its default grid"""
+    asset_info = SUPPORTED_ASSETS[symbol]
+
+    try:
+        data = shared_fetcher.fetch_data(
+            symbol=symbol,
+            start_date='2024-06-01',
+            end_date='2024-12-31',
+            interval='1d'
+        )
+    except (ValueError, OSError) as e:
+        pytest.skip(f"{symbol} data unavailable: {e}")
+
+    data_with_indicators = shared_fetcher.add_technical_indicators(data)
+
+    strategy = GridTradingStrategy(
+        midprice=asset_info['midprice'],
+        grid_distance=asset_info['grid_distance'],
+        grid_range=asset_info['grid_range']
+    )
+    prepared = strategy.prepare_data(data_with_indicators)
+
+    signals = prepared['signal'].to_numpy()
+    assert len(signals) == len(prepared)
+    assert np.isin(signals, (0, 1)).all()
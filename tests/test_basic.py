@@ -5,14 +5,10 @@ Basic tests for Grid Trading Strategy
 import pytest
 import pandas as pd
 import numpy as np
-import sys
-import os
-
-# Add src to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from src.data.fetcher import DataFetcher
-from src.strategy.grid_trading import GridGenerator, GridSignalGenerator, GridTradingStrategy
+from src.strategy.grid_trading import (GridGenerator, GridSignalGenerator,
+                                       GridTradingStrategy, _grid_signals_kernel)
 from src.backtest.backtester import GridBacktester
 
 
@@ -34,45 +30,68 @@ class TestGridGenerator:
         generator = GridGenerator(midprice=midprice, grid_distance=0.01, grid_range=0.1)
         grid = generator.get_grid_levels()
         
-        # Check if there are levels both above and below midprice
-        levels_below = grid[grid < midprice]
-        levels_above = grid[grid > midprice]
-        
-        assert len(levels_below) > 0
-        assert len(levels_above) > 0
+        # Check if there are levels both above and below midprice: the grid
+        # is sorted, so one binary search replaces two boolean-mask scans
+        idx = np.searchsorted(grid, midprice)
+
+        assert idx > 0  # At least one level below
+        assert idx < len(grid)  # At least one level above
+
+    def test_count_between(self):
+        """Range queries over the sorted grid, scalar and array bounds"""
+        generator = GridGenerator(midprice=1.0, grid_distance=0.1, grid_range=0.5)
+        grid = generator.get_grid_levels()
+
+        # Scalar bounds: the whole grid, and a gap between two levels
+        assert generator.count_between(0.0, 2.0) == len(grid)
+        assert generator.count_between(1.31, 1.39) == 0
+
+        # Array bounds: "any level in [low, high]" must agree with the
+        # signal kernel over random candle ranges
+        rng = np.random.default_rng(7)
+        lows = (0.4 + rng.random(200)).astype(np.float32)
+        highs = (lows + rng.random(200) * 0.2).astype(np.float32)
+
+        counts = generator.count_between(lows, highs)
+        signals = _grid_signals_kernel(lows, highs, grid)
+
+        assert np.array_equal((counts > 0).astype(np.int8), signals)
+
+
+@pytest.fixture(scope="module")
+def sample_ohlcv():
+    """Sample OHLCV data, built once per test module"""
+    dates = pd.date_range('2024-01-01', periods=100, freq='5min')
+    rng = np.random.default_rng(42)
+
+    # One (n, 4) draw instead of four separate legacy-RNG calls
+    noise = rng.standard_normal((100, 4)) * 0.001
+    high = 1.061 + noise[:, 1]
+    low = 1.059 + noise[:, 2]
+    np.maximum(high, low, out=high)  # Ensure High >= Low, in place
+
+    return pd.DataFrame({
+        'Open': 1.06 + noise[:, 0],
+        'High': high,
+        'Low': low,
+        'Close': 1.060 + noise[:, 3],
+        'Volume': rng.integers(1000, 10000, 100)
+    }, index=dates)
 
 
 class TestGridSignalGenerator:
     """Test Grid Signal Generator functionality"""
-    
-    def create_sample_data(self):
-        """Create sample OHLCV data for testing"""
-        dates = pd.date_range('2024-01-01', periods=100, freq='5min')
-        np.random.seed(42)
-        
-        data = pd.DataFrame({
-            'Open': 1.06 + np.random.randn(100) * 0.001,
-            'High': 1.061 + np.random.randn(100) * 0.001,
-            'Low': 1.059 + np.random.randn(100) * 0.001,
-            'Close': 1.060 + np.random.randn(100) * 0.001,
-            'Volume': np.random.randint(1000, 10000, 100)
-        }, index=dates)
-        
-        # Ensure High >= Low
-        data['High'] = np.maximum(data['High'], data['Low'])
-        
-        return data
-    
-    def test_signal_generation(self):
+
+    def test_signal_generation(self, sample_ohlcv):
         """Test signal generation"""
         grid_levels = np.array([1.058, 1.059, 1.060, 1.061, 1.062])
         generator = GridSignalGenerator(grid_levels)
-        
-        data = self.create_sample_data()
+
+        data = sample_ohlcv
         signals = generator.generate_signals(data)
-        
+
         assert len(signals) == len(data)
-        assert all(signal in [0, 1] for signal in signals)
+        assert np.isin(np.asarray(signals), (0, 1)).all()
         assert sum(signals) >= 0  # Should have some signals
 
 
@@ -149,19 +168,22 @@ def run_basic_tests():
     print("✓ Testing signal generation...")
     signal_gen = GridSignalGenerator(grid)
     
-    # Create sample data
+    # Create sample data (one (n, 4) draw, High >= Low fixed up in place)
     dates = pd.date_range('2024-01-01', periods=50, freq='5min')
+    rng = np.random.default_rng()
+    noise = rng.standard_normal((50, 4)) * 0.002
+    high = 1.067 + noise[:, 1]
+    low = 1.063 + noise[:, 2]
+    np.maximum(high, low, out=high)
+
     sample_data = pd.DataFrame({
-        'Open': np.random.normal(1.065, 0.002, 50),
-        'High': np.random.normal(1.067, 0.002, 50),
-        'Low': np.random.normal(1.063, 0.002, 50),
-        'Close': np.random.normal(1.065, 0.002, 50),
-        'Volume': np.random.randint(1000, 5000, 50)
+        'Open': 1.065 + noise[:, 0],
+        'High': high,
+        'Low': low,
+        'Close': 1.065 + noise[:, 3],
+        'Volume': rng.integers(1000, 5000, 50)
     }, index=dates)
-    
-    # Ensure High >= Low
-    sample_data['High'] = np.maximum(sample_data['High'], sample_data['Low'])
-    
+
     signals = signal_gen.generate_signals(sample_data)
     print(f"  Generated {sum(signals)} signals from {len(signals)} candles")
     
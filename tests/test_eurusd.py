@@ -1,120 +1,200 @@
 #!/usr/bin/env python3
 """
-Test script for EUR/USD grid trading with corrected parameters
+Tests for EUR/USD grid trading with corrected parameters
 """
 
-import sys
+import hashlib
 import os
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
 
 from src.data.fetcher import DataFetcher
 from src.strategy.grid_trading import GridTradingStrategy
 from src.visualization.charts import GridTradingVisualizer
 from config.settings import SUPPORTED_ASSETS
 
-def test_eurusd_grid():
-    """Test EUR/USD with corrected parameters"""
-    
-    # Configuration for EUR/USD
-    asset_info = SUPPORTED_ASSETS['EURUSD=X']
-    print(f"🧪 Testing {asset_info['name']} with corrected parameters:")
-    print(f"   Midprice: {asset_info['midprice']}")
-    print(f"   Grid Distance: {asset_info['grid_distance']}")
-    print(f"   Grid Range: {asset_info['grid_range']}")
-    
-    # Fetch data
-    print("\n📊 Fetching EUR/USD data...")
-    fetcher = DataFetcher()
-    
+ASSET_INFO = SUPPORTED_ASSETS['EURUSD=X']
+
+# Disk cache for fetched test data, keyed on the request parameters, so only
+# the first run pays the yfinance network round-trip
+_CACHE_DIR = Path(__file__).parent / "cache"
+
+
+def _fetch_cached(fetcher, symbol, start_date, end_date, interval):
+    """Fetch via DataFetcher with a local parquet cache in front"""
+    key = hashlib.sha256(f"{symbol}|{start_date}|{end_date}|{interval}".encode()).hexdigest()
+    cache_file = _CACHE_DIR / f"{key}.parquet"
+
+    if cache_file.exists():
+        return pd.read_parquet(cache_file)
+
+    data = fetcher.fetch_data(symbol=symbol, start_date=start_date,
+                              end_date=end_date, interval=interval)
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        data.to_parquet(cache_file, compression="zstd")
+    except OSError as e:
+        print(f"⚠️ Could not write test cache {cache_file}: {e}")
+    return data
+
+
+# Indicator results memoized on a cheap data fingerprint - the computation is
+# deterministic in the input, so repeat invocations skip the pandas recompute
+_INDICATOR_CACHE = {}
+
+
+def _cached_indicators(fetcher, data):
+    """add_technical_indicators with module-level memoization"""
+    key = (len(data), float(data['Close'].iloc[0]),
+           float(data['Close'].iloc[-1]), data.index[-1].value)
+    if key not in _INDICATOR_CACHE:
+        _INDICATOR_CACHE[key] = fetcher.add_technical_indicators(data)
+    return _INDICATOR_CACHE[key]
+
+
+@pytest.fixture(scope="module")
+def fetcher():
+    """One DataFetcher shared by every test in this module"""
+    return DataFetcher()
+
+
+@pytest.fixture(scope="module")
+def data_with_indicators(fetcher):
+    """EUR/USD daily data with indicators, fetched once per test session"""
     try:
         # Use recent data to avoid weekend issues
-        data = fetcher.fetch_data(
+        data = _fetch_cached(
+            fetcher,
             symbol='EURUSD=X',
             start_date='2024-06-01',
             end_date='2024-12-31',
             interval='1d'
         )
-        
-        data_with_indicators = fetcher.add_technical_indicators(data)
-        print(f"✅ Fetched {len(data_with_indicators)} data points")
-        print(f"   Price range: {data_with_indicators['Close'].min():.4f} - {data_with_indicators['Close'].max():.4f}")
-        
-        # Test static midprice
-        print("\n🎯 Testing with static midprice...")
-        strategy_static = GridTradingStrategy(
-            midprice=asset_info['midprice'],
-            grid_distance=asset_info['grid_distance'],
-            grid_range=asset_info['grid_range']
-        )
-        
-        grid_levels = strategy_static.grid_generator.get_grid_levels()
-        print(f"   Grid levels: {len(grid_levels)}")
-        print(f"   Level range: {grid_levels.min():.4f} - {grid_levels.max():.4f}")
-        
-        prepared_data_static = strategy_static.prepare_data(data_with_indicators)
-        signals_static = prepared_data_static['signal'].sum()
-        print(f"   Signals generated: {signals_static}")
-        
-        # Test dynamic midprice
-        print("\n🔄 Testing with dynamic midprice...")
-        dynamic_midprice = fetcher.get_dynamic_midprice(data_with_indicators)
-        print(f"   Dynamic midprice: {dynamic_midprice:.4f}")
-        
-        strategy_dynamic = GridTradingStrategy(
-            midprice=dynamic_midprice,
-            grid_distance=asset_info['grid_distance'],
-            grid_range=asset_info['grid_range']
-        )
-        
-        grid_levels_dynamic = strategy_dynamic.grid_generator.get_grid_levels()
-        print(f"   Grid levels: {len(grid_levels_dynamic)}")
-        print(f"   Level range: {grid_levels_dynamic.min():.4f} - {grid_levels_dynamic.max():.4f}")
-        
-        prepared_data_dynamic = strategy_dynamic.prepare_data(data_with_indicators)
-        signals_dynamic = prepared_data_dynamic['signal'].sum()
-        print(f"   Signals generated: {signals_dynamic}")
-        
-        # Test visualization
-        print("\n📈 Testing visualization...")
-        visualizer = GridTradingVisualizer()
-        
-        try:
-            fig = visualizer.plot_price_with_grid(
-                data=prepared_data_dynamic,
-                grid_levels=grid_levels_dynamic,
-                title="EUR/USD Test - Grid Trading Signals"
-            )
-            print("✅ Visualization created successfully")
-            print(f"   Chart contains {len(fig.data)} traces")
-            
-            # Save as HTML for testing
-            fig.write_html("test_eurusd_chart.html")
-            print("✅ Chart saved as test_eurusd_chart.html")
-            
-        except Exception as e:
-            print(f"❌ Visualization error: {e}")
-        
-        # Summary
-        print("\n📋 Summary:")
-        print(f"   Best configuration: {'Dynamic' if signals_dynamic > signals_static else 'Static'} midprice")
-        print(f"   Max signals: {max(signals_static, signals_dynamic)}")
-        print(f"   Grid efficiency: {max(signals_static, signals_dynamic) / len(data_with_indicators) * 100:.1f}% of candles have signals")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        return False
-
-if __name__ == "__main__":
-    print("🚀 EUR/USD Grid Trading Test")
-    print("=" * 40)
-    
-    success = test_eurusd_grid()
-    
-    if success:
-        print("\n✅ Test completed successfully!")
-        print("💡 You can now use EUR/USD in the Streamlit app with confidence.")
-    else:
-        print("\n❌ Test failed!")
-        print("💡 Check the error messages above for troubleshooting.")
+    except (ValueError, OSError) as e:
+        # ValueError: empty download; OSError: network/disk failure.
+        # Anything else is a real bug and should fail loudly.
+        pytest.skip(f"EUR/USD data unavailable: {e}")
+
+    df = _cached_indicators(fetcher, data)
+
+    # Downcast float64 indicator columns (prices already arrive float32);
+    # the later scans are memory-bound, so halving the dtype halves them
+    for c in df.select_dtypes('float64').columns:
+        df[c] = pd.to_numeric(df[c], downcast='float')
+
+    return df
+
+
+@pytest.fixture(scope="module")
+def prepared(fetcher, data_with_indicators):
+    """Static- and dynamic-midprice strategies with prepared signal data
+
+    The two preparations are independent and spend their time in vectorized
+    numpy/pandas code that releases the GIL, so they run concurrently on
+    threads (no pickling, shared input frame).
+    """
+    strategy_static = GridTradingStrategy(
+        midprice=ASSET_INFO['midprice'],
+        grid_distance=ASSET_INFO['grid_distance'],
+        grid_range=ASSET_INFO['grid_range']
+    )
+    strategy_dynamic = GridTradingStrategy(
+        midprice=fetcher.get_dynamic_midprice(data_with_indicators),
+        grid_distance=ASSET_INFO['grid_distance'],
+        grid_range=ASSET_INFO['grid_range']
+    )
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        future_static = executor.submit(strategy_static.prepare_data, data_with_indicators)
+        future_dynamic = executor.submit(strategy_dynamic.prepare_data, data_with_indicators)
+        return {
+            'static': (strategy_static, future_static.result()),
+            'dynamic': (strategy_dynamic, future_dynamic.result()),
+        }
+
+
+def test_fetched_data(data_with_indicators):
+    """Fetched data covers the requested range with a sane price band"""
+    assert len(data_with_indicators) > 0
+
+    # Reductions on the raw buffer skip the Series dispatch overhead
+    close = data_with_indicators['Close'].to_numpy()
+    assert 0 < close.min() <= close.max()
+
+
+def test_static_strategy(prepared):
+    """Static midprice: grid spans the configured range and yields signals"""
+    strategy, prepared_data = prepared['static']
+
+    grid_levels = strategy.grid_generator.get_grid_levels()
+    assert len(grid_levels) > 0
+    assert grid_levels.min() >= ASSET_INFO['midprice'] - ASSET_INFO['grid_range']
+    assert grid_levels.max() <= ASSET_INFO['midprice'] + ASSET_INFO['grid_range']
+
+    signals = prepared_data['signal'].to_numpy()
+    assert len(signals) == len(prepared_data)
+    assert np.isin(signals, (0, 1)).all()
+
+
+def test_dynamic_strategy(fetcher, data_with_indicators, prepared):
+    """Dynamic midprice recenters the grid on the MA-20"""
+    strategy, prepared_data = prepared['dynamic']
+
+    dynamic_midprice = fetcher.get_dynamic_midprice(data_with_indicators)
+    grid_levels = strategy.grid_generator.get_grid_levels()
+    assert grid_levels.min() <= dynamic_midprice <= grid_levels.max()
+    assert np.isin(prepared_data['signal'].to_numpy(), (0, 1)).all()
+
+
+def test_signal_kernels_agree(data_with_indicators, prepared):
+    """The optional numba kernel must match the searchsorted reference"""
+    from src.strategy.grid_trading import _grid_signals_kernel, _grid_signals_numba
+
+    if _grid_signals_numba is None:
+        pytest.skip("numba not installed")
+
+    strategy, _ = prepared['static']
+    levels = np.sort(strategy.grid_generator.get_grid_levels()).astype(np.float32)
+    lows = data_with_indicators['Low'].to_numpy(dtype=np.float32)
+    highs = data_with_indicators['High'].to_numpy(dtype=np.float32)
+
+    assert np.array_equal(_grid_signals_kernel(lows, highs, levels),
+                          _grid_signals_numba(lows, highs, levels))
+
+
+def test_visualization(prepared):
+    """The prepared data and grid render into a Plotly figure"""
+    strategy, prepared_data = prepared['dynamic']
+
+    fig = GridTradingVisualizer().plot_price_with_grid(
+        data=prepared_data,
+        grid_levels=strategy.grid_generator.get_grid_levels(),
+        title="EUR/USD Test - Grid Trading Signals"
+    )
+    assert len(fig.data) > 0
+
+    # to_json checks the figure serializes without the plotly.js bundle,
+    # inline CSS and HTML wrapping that write_html would add
+    payload = fig.to_json()
+    assert payload.startswith('{')
+
+    # Saving the payload for inspection is opt-in
+    if os.environ.get("SAVE_CHART"):
+        with open("test_eurusd_chart.json", "w") as f:
+            f.write(payload)
+
+
+def test_grid_efficiency(data_with_indicators, prepared):
+    """At least one configuration produces signals on this range"""
+    signals_static = int(np.count_nonzero(prepared['static'][1]['signal'].to_numpy()))
+    signals_dynamic = int(np.count_nonzero(prepared['dynamic'][1]['signal'].to_numpy()))
+
+    best = max(signals_static, signals_dynamic)
+    efficiency = 100 * best / len(data_with_indicators)
+
+    assert best > 0
+    assert 0 < efficiency <= 100